@@ -68,15 +68,23 @@ class JPEGArtifactFilter(BaseFilter):
 class SkewPerspectiveFilter(BaseFilter):
     """Applies skew and perspective warp to simulate scanner misalignment."""
 
-    def __init__(self, max_skew: float = 2.0, max_perspective: float = 0.01):
+    def __init__(
+        self,
+        max_skew: float = 2.0,
+        max_perspective: float = 0.01,
+        rng: np.random.Generator | None = None,
+    ):
         """Initialize skew and perspective filter.
 
         Args:
             max_skew: Maximum skew angle in degrees (±)
             max_perspective: Maximum perspective warp factor (±)
+            rng: Random generator to draw warps from; defaults to the global
+                NumPy state (seeded from NOISE_SEED by GrungeWorksAgent)
         """
         self.max_skew = max_skew
         self.max_perspective = max_perspective
+        self.rng = rng
 
     def apply(self, img: Image.Image) -> Image.Image:
         """Apply skew and perspective warp."""
@@ -84,13 +92,13 @@ class SkewPerspectiveFilter(BaseFilter):
         img_array = np.array(img)
         h, w = img_array.shape[:2]
 
+        rng = self.rng if self.rng is not None else np.random
+
         # Generate random skew angle
-        skew_angle = np.random.uniform(-self.max_skew, self.max_skew)
+        skew_angle = rng.uniform(-self.max_skew, self.max_skew)
 
         # Generate random perspective warp
-        perspective_factor = np.random.uniform(
-            -self.max_perspective, self.max_perspective
-        )
+        perspective_factor = rng.uniform(-self.max_perspective, self.max_perspective)
 
         # Create transformation matrix for skew
         skew_rad = np.radians(skew_angle)
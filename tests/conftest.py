@@ -0,0 +1,41 @@
+"""
+Shared pytest fixtures exposing the mock symbols tree from fixtures.py.
+The tree is built once per session and is read-only for tests.
+
+Also records which tests have actually run in this process, for
+coverage analysis that reuses an outer coverage session.
+"""
+
+import pytest
+
+from .fixtures import _make_symbols_dir
+
+
+@pytest.fixture(scope="session")
+def with_svgs(tmp_path_factory):
+    """Temp root with the manifest, mock SVGs and licence sheet"""
+    temp_dir = tmp_path_factory.mktemp("with_svgs")
+    _make_symbols_dir(temp_dir)
+    return temp_dir
+
+
+@pytest.fixture(scope="session")
+def shared_symbols_dir(with_svgs):
+    """Read-only symbols/ directory (manifest, SVGs, licence sheet) shared by the session"""
+    return with_svgs / "symbols"
+
+
+_RAN_NODEIDS = pytest.StashKey[set]()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Record each test's nodeid once its setup, call and teardown have run"""
+    yield
+    item.session.stash.setdefault(_RAN_NODEIDS, set()).add(item.nodeid)
+
+
+@pytest.fixture(scope="session")
+def ran_test_nodeids(request):
+    """Live set of nodeids of the tests that have run in this process so far"""
+    return request.session.stash.setdefault(_RAN_NODEIDS, set())
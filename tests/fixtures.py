@@ -3,13 +3,156 @@ Test fixtures and mock data for comprehensive testing across all agents.
 Provides consistent test data for VectorForge, LayoutLab, GrungeWorks, and integration tests.
 """
 
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional
+import atexit
+import io
+import os
+import shutil
+import stat
 import tempfile
+import weakref
 import json
-import yaml
 from dataclasses import dataclass
-from PIL import Image, ImageDraw
+from types import MappingProxyType
+
+# yaml and PIL are imported where used so collecting tests that never touch them stays cheap
+if TYPE_CHECKING:
+    from PIL import Image
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Base directory for fixture temp trees; point DAED_TEST_TMPFS at a ramdisk to cut test I/O
+_TEST_TMP_ROOT = os.environ.get("DAED_TEST_TMPFS") or tempfile.gettempdir()
+
+
+def _chmod_and_retry(func, path, _exc_info) -> None:
+    """rmtree onerror hook: clear read-only bits and retry, ignoring anything still failing"""
+    try:
+        os.chmod(path, stat.S_IWRITE)
+        func(path)
+    except OSError:
+        pass
+
+
+def _remove_tree(path: Path) -> None:
+    """Best-effort recursive delete of a fixture temp tree"""
+    if os.path.exists(path):
+        shutil.rmtree(path, onerror=_chmod_and_retry)
+
+
+def _write_raw(path: Path, data: bytes) -> None:
+    """Write a small file with bare os calls, skipping Python file-object setup"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=None)
+def _render_mock_png(width: int, height: int) -> "Image.Image":
+    """Rasterize the mock page once per size; treat the result as read-only"""
+    # Stroked primitives are slow in stock Pillow, but this runs once per size,
+    # so a SIMD Pillow build buys nothing here
+    from PIL import Image, ImageDraw
+    
+    img = Image.new('RGB', (width, height), 'white')
+    draw = ImageDraw.Draw(img)
+    
+    # Draw some mock symbols
+    draw.rectangle([50, 50, 150, 100], outline='black', width=2)
+    draw.ellipse([200, 80, 280, 160], outline='black', width=2)
+    draw.polygon([(100, 200), (150, 180), (200, 200), (175, 240)], outline='black', width=2)
+    
+    return img
+
+
+def _freeze(obj: Any) -> Any:
+    """Recursively convert dicts to MappingProxyType and lists to tuples"""
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(item) for item in obj)
+    return obj
+
+
+def _json_dumps(obj: Any, indent: bool = True, sort_keys: bool = False) -> bytes:
+    """Serialize test data as JSON bytes (indented unless indent=False), via orjson when available"""
+    if ORJSON_AVAILABLE:
+        option = (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, via orjson when available"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+# Simple mock PDF header + minimal content
+_MOCK_PDF_BYTES = b"""%PDF-1.4
+1 0 obj
+<<
+/Type /Catalog
+/Pages 2 0 R
+>>
+endobj
+
+2 0 obj
+<<
+/Type /Pages
+/Kids [3 0 R]
+/Count 1
+>>
+endobj
+
+3 0 obj
+<<
+/Type /Page
+/Parent 2 0 R
+/MediaBox [0 0 612 792]
+>>
+endobj
+
+xref
+0 4
+0000000000 65535 f 
+0000000010 00000 n 
+0000000053 00000 n 
+0000000125 00000 n 
+trailer
+<<
+/Size 4
+/Root 1 0 R
+>>
+startxref
+199
+%%EOF"""
+
+_SVG_TEMPLATES = {
+    "flatness": '''<?xml version="1.0" encoding="UTF-8"?>
+<svg width="8mm" height="8mm" viewBox="0 0 8 8" xmlns="http://www.w3.org/2000/svg">
+    <rect x="1" y="1" width="6" height="6" stroke="black" stroke-width="0.2" fill="none"/>
+    <line x1="3" y1="4" x2="5" y2="4" stroke="black" stroke-width="0.15"/>
+</svg>''',
+    "diameter": '''<?xml version="1.0" encoding="UTF-8"?>
+<svg width="6mm" height="6mm" viewBox="0 0 6 6" xmlns="http://www.w3.org/2000/svg">
+    <circle cx="3" cy="3" r="2.5" stroke="black" stroke-width="0.2" fill="none"/>
+    <line x1="1" y1="1" x2="5" y2="5" stroke="black" stroke-width="0.15"/>
+</svg>''',
+    "surface_finish_triangle": '''<?xml version="1.0" encoding="UTF-8"?>
+<svg width="6mm" height="6mm" viewBox="0 0 6 6" xmlns="http://www.w3.org/2000/svg">
+    <polygon points="3,1 1,5 5,5" stroke="black" stroke-width="0.2" fill="none"/>
+</svg>'''
+}
 
 
 @dataclass
@@ -164,26 +307,16 @@ class TestFixtures:
             ]
         }
     
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_manifest_dict() -> Mapping[str, Any]:
+        """Get a shared, read-only in-memory manifest, skipping the YAML round-trip"""
+        return _freeze(TestFixtures.get_mock_symbols_manifest())
+    
     @staticmethod
     def get_mock_svg_content(symbol_name: str) -> str:
         """Get mock SVG content for symbol"""
-        svg_templates = {
-            "flatness": '''<?xml version="1.0" encoding="UTF-8"?>
-<svg width="8mm" height="8mm" viewBox="0 0 8 8" xmlns="http://www.w3.org/2000/svg">
-    <rect x="1" y="1" width="6" height="6" stroke="black" stroke-width="0.2" fill="none"/>
-    <line x1="3" y1="4" x2="5" y2="4" stroke="black" stroke-width="0.15"/>
-</svg>''',
-            "diameter": '''<?xml version="1.0" encoding="UTF-8"?>
-<svg width="6mm" height="6mm" viewBox="0 0 6 6" xmlns="http://www.w3.org/2000/svg">
-    <circle cx="3" cy="3" r="2.5" stroke="black" stroke-width="0.2" fill="none"/>
-    <line x1="1" y1="1" x2="5" y2="5" stroke="black" stroke-width="0.15"/>
-</svg>''',
-            "surface_finish_triangle": '''<?xml version="1.0" encoding="UTF-8"?>
-<svg width="6mm" height="6mm" viewBox="0 0 6 6" xmlns="http://www.w3.org/2000/svg">
-    <polygon points="3,1 1,5 5,5" stroke="black" stroke-width="0.2" fill="none"/>
-</svg>'''
-        }
-        return svg_templates.get(symbol_name, svg_templates["diameter"])
+        return _SVG_TEMPLATES.get(symbol_name, _SVG_TEMPLATES["diameter"])
     
     @staticmethod
     def get_mock_page_data() -> Dict[str, Any]:
@@ -228,6 +361,16 @@ class TestFixtures:
             ]
         }
     
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_page_data_dict() -> Mapping[str, Any]:
+        """Get a shared, read-only view of the mock page data
+        
+        Tests that modify the page, or need real dicts and lists (e.g. for JSON
+        serialization or isinstance checks), should call get_mock_page_data.
+        """
+        return _freeze(TestFixtures.get_mock_page_data())
+    
     @staticmethod
     def get_mock_license_data() -> List[Dict[str, str]]:
         """Get mock license data for VectorForge compliance"""
@@ -244,109 +387,106 @@ class TestFixtures:
     @staticmethod
     def create_mock_pdf_bytes() -> bytes:
         """Create mock PDF content for testing"""
-        # Simple mock PDF header + minimal content
-        mock_pdf = b"""%PDF-1.4
-1 0 obj
-<<
-/Type /Catalog
-/Pages 2 0 R
->>
-endobj
-
-2 0 obj
-<<
-/Type /Pages
-/Kids [3 0 R]
-/Count 1
->>
-endobj
-
-3 0 obj
-<<
-/Type /Page
-/Parent 2 0 R
-/MediaBox [0 0 612 792]
->>
-endobj
-
-xref
-0 4
-0000000000 65535 f 
-0000000010 00000 n 
-0000000053 00000 n 
-0000000125 00000 n 
-trailer
-<<
-/Size 4
-/Root 1 0 R
->>
-startxref
-199
-%%EOF"""
-        return mock_pdf
+        return _MOCK_PDF_BYTES
     
     @staticmethod
-    def create_mock_png_image(width: int = 400, height: int = 300) -> Image.Image:
+    def create_mock_png_image(width: int = 400, height: int = 300) -> "Image.Image":
         """Create mock PNG image for testing"""
-        img = Image.new('RGB', (width, height), 'white')
-        draw = ImageDraw.Draw(img)
-        
-        # Draw some mock symbols
-        draw.rectangle([50, 50, 150, 100], outline='black', width=2)
-        draw.ellipse([200, 80, 280, 160], outline='black', width=2)
-        draw.polygon([(100, 200), (150, 180), (200, 200), (175, 240)], outline='black', width=2)
-        
-        return img
+        # Callers may draw on or filter the result, so hand out a private copy
+        return _render_mock_png(width, height).copy()
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_mock_png_bytes(width: int = 400, height: int = 300) -> bytes:
+        """Get encoded mock PNG bytes, rendered once per size"""
+        buf = io.BytesIO()
+        # Fast zlib level - fixture output does not need to be small
+        _render_mock_png(width, height).save(buf, format='PNG', compress_level=1)
+        return buf.getvalue()
     
     @staticmethod
     def create_temporary_files():
         """Create temporary files for testing"""
-        temp_dir = Path(tempfile.mkdtemp())
-        
-        # Create mock symbols directory structure
-        symbols_dir = temp_dir / "symbols"
-        symbols_dir.mkdir()
-        
-        # Create mock manifest
-        manifest_path = symbols_dir / "symbols_manifest.yaml"
-        with open(manifest_path, 'w') as f:
-            yaml.dump(TestFixtures.get_mock_symbols_manifest(), f)
-        
-        # Create mock SVG files
-        manifest = TestFixtures.get_mock_symbols_manifest()
-        for symbol in manifest["symbols"]:
-            svg_path = symbols_dir / symbol["filename"]
-            with open(svg_path, 'w') as f:
-                f.write(TestFixtures.get_mock_svg_content(symbol["name"]))
-        
-        # Create mock license CSV
-        license_path = symbols_dir / "symbol_licences.csv"
-        with open(license_path, 'w') as f:
-            f.write("filename,licence,source-URL\n")
-            for license_data in TestFixtures.get_mock_license_data():
-                f.write(f"{license_data['filename']},{license_data['licence']},{license_data['source-URL']}\n")
-        
-        # Create mock examples directory
-        examples_dir = temp_dir / "examples"
-        examples_dir.mkdir()
-        
-        # Create mock page JSON
-        page_json_path = examples_dir / "page_abcd1234.json"
-        with open(page_json_path, 'w') as f:
-            json.dump(TestFixtures.get_mock_page_data(), f, indent=2)
-        
-        # Create mock PDF
-        pdf_path = examples_dir / "page_abcd1234.pdf"
-        with open(pdf_path, 'wb') as f:
-            f.write(TestFixtures.create_mock_pdf_bytes())
-        
-        # Create mock PNG
-        png_path = examples_dir / "page_abcd1234.png"
-        TestFixtures.create_mock_png_image().save(png_path)
+        temp_dir = Path(tempfile.mkdtemp(dir=_TEST_TMP_ROOT))
+        # Callers rarely remove this tree themselves; make sure it never outlives the session
+        atexit.register(_remove_tree, temp_dir)
         
+        _make_all(temp_dir)
         return temp_dir
 
 
+# Whole licence sheet rendered once so it is written with a single call
+_LICENSE_CSV_BYTES = (
+    "filename,licence,source-URL\n"
+    + "".join(
+        f"{row['filename']},{row['licence']},{row['source-URL']}\n"
+        for row in TestFixtures.get_mock_license_data()
+    )
+).encode()
+
+def _make_symbols_dir(temp_dir: Path) -> Path:
+    """Create temp_dir/symbols with the manifest, mock SVGs and licence sheet"""
+    import yaml
+    
+    # Create mock symbols directory structure
+    symbols_dir = temp_dir / "symbols"
+    symbols_dir.mkdir()
+    
+    # Create mock manifest
+    manifest = TestFixtures.get_mock_symbols_manifest()
+    manifest_path = symbols_dir / "symbols_manifest.yaml"
+    with open(manifest_path, 'w') as f:
+        yaml.dump(manifest, f)
+    
+    # Create mock SVG files
+    for symbol in manifest["symbols"]:
+        _write_raw(
+            symbols_dir / symbol["filename"],
+            TestFixtures.get_mock_svg_content(symbol["name"]).encode(),
+        )
+    
+    # Create mock license CSV
+    license_path = symbols_dir / "symbol_licences.csv"
+    license_path.write_bytes(_LICENSE_CSV_BYTES)
+    
+    return symbols_dir
+
+
+def _make_examples_dir(temp_dir: Path) -> Path:
+    """Create temp_dir/examples with a rendered JSON/PDF/PNG page trio"""
+    examples_dir = temp_dir / "examples"
+    examples_dir.mkdir()
+    
+    # Mock page JSON, PDF and PNG
+    (examples_dir / "page_abcd1234.json").write_bytes(_json_dumps(TestFixtures.get_mock_page_data()))
+    (examples_dir / "page_abcd1234.pdf").write_bytes(_MOCK_PDF_BYTES)
+    (examples_dir / "page_abcd1234.png").write_bytes(TestFixtures.get_mock_png_bytes())
+    
+    return examples_dir
+
+
+def _make_all(temp_dir: Path) -> Path:
+    """Populate temp_dir with the full symbols + examples tree"""
+    _make_symbols_dir(temp_dir)
+    _make_examples_dir(temp_dir)
+    return temp_dir
+
+
+def _build_stress_page(index: int, base_page: Dict[str, Any]) -> Dict[str, Any]:
+    """Build one stress-test page from the base page"""
+    base_annotations = base_page["annotations"]
+    # Vary number of symbols per page (10-60)
+    symbol_count = 10 + (index % 51)
+    # Duplicate annotations to reach target count in one multiply-and-slice
+    repeats = symbol_count // len(base_annotations) + 1
+    
+    # Build page_info explicitly so pages never share (and mutate) the base dict
+    return {
+        "page_info": {**base_page["page_info"], "commit_sha": f"sha{index:04d}"},
+        "annotations": (base_annotations * repeats)[:symbol_count],
+    }
+
+
 class PerformanceFixtures:
     """Fixtures for performance and stress testing"""
     
@@ -354,47 +494,40 @@ class PerformanceFixtures:
     def get_large_symbol_set(count: int = 100) -> List[Dict[str, Any]]:
         """Generate large symbol set for stress testing"""
         base_symbols = TestFixtures.get_mock_symbols_manifest()["symbols"]
-        large_set = []
-        
-        for i in range(count):
-            # Cycle through base symbols and create variations
-            base_symbol = base_symbols[i % len(base_symbols)]
-            variant = base_symbol.copy()
-            variant["name"] = f"{base_symbol['name']}_variant_{i}"
-            variant["filename"] = f"{base_symbol['filename'].replace('.svg', f'_v{i}.svg')}"
-            large_set.append(variant)
+        # Strip the .svg suffix once per base symbol rather than per variant
+        bases = [(s["name"], s["filename"][:-len(".svg")], s) for s in base_symbols]
+        n = len(bases)
         
-        return large_set
+        # Cycle through base symbols and create variations
+        return [
+            {
+                **bases[i % n][2],
+                "name": f"{bases[i % n][0]}_variant_{i}",
+                "filename": f"{bases[i % n][1]}_v{i}.svg",
+            }
+            for i in range(count)
+        ]
     
     @staticmethod
     def get_stress_test_pages(page_count: int = 100) -> List[Dict[str, Any]]:
         """Generate multiple pages for stress testing"""
         base_page = TestFixtures.get_mock_page_data()
-        pages = []
-        
-        for i in range(page_count):
-            page = base_page.copy()
-            page["page_info"]["commit_sha"] = f"sha{i:04d}"
-            # Vary number of symbols per page (10-60)
-            symbol_count = 10 + (i % 51)
-            # Truncate or extend annotations as needed
-            if symbol_count <= len(page["annotations"]):
-                page["annotations"] = page["annotations"][:symbol_count]
-            else:
-                # Duplicate annotations to reach target count
-                while len(page["annotations"]) < symbol_count:
-                    page["annotations"].extend(base_page["annotations"])
-                page["annotations"] = page["annotations"][:symbol_count]
-            
-            pages.append(page)
-        
-        return pages
+        return [_build_stress_page(i, base_page) for i in range(page_count)]
+
 
 
 class MockFileSystem:
     """Mock file system operations for testing"""
     
-    def __init__(self, temp_dir: Path):
+    def __init__(self, temp_dir: Optional[Path] = None):
+        """Use temp_dir, or a fresh temp directory owned by this object if None"""
+        if temp_dir is None:
+            temp_dir = Path(tempfile.mkdtemp(dir=_TEST_TMP_ROOT))
+            # Remove our own tree when this object is collected, even without cleanup()
+            self._finalizer = weakref.finalize(self, _remove_tree, temp_dir)
+        else:
+            # Caller-supplied directories are only removed by an explicit cleanup()
+            self._finalizer = partial(_remove_tree, temp_dir)
         self.temp_dir = temp_dir
         self.symbols_dir = temp_dir / "symbols"
         self.examples_dir = temp_dir / "examples"
@@ -412,6 +545,4 @@ class MockFileSystem:
     
     def cleanup(self):
         """Clean up temporary files"""
-        import shutil
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
\ No newline at end of file
+        self._finalizer()
\ No newline at end of file
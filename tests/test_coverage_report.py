@@ -3,10 +3,17 @@ Test coverage measurement and reporting system for QualityGate.
 Measures and reports test coverage across all agents to achieve 80%+ target.
 """
 
+import importlib.util
+import io
 import os
+import re
 import sys
 import subprocess
+import tempfile
 import json
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Dict, List, Any, Tuple
 import pytest
@@ -14,6 +21,63 @@ import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 from datetime import datetime
 
+from .fixtures import _json_dumps
+
+
+@lru_cache(maxsize=None)
+def _count_tests(path: str, mtime_ns: int) -> int:
+    """Test-function count for one file, keyed on its own mtime so in-place edits rescan it"""
+    # The marker is pure ASCII, so count on raw bytes and skip decoding
+    with open(path, 'rb') as f:
+        return f.read().count(b"def test_")
+
+
+def _scan_tests(tests_dir: str) -> Dict[Path, int]:
+    """Single pass over tests_dir: every test_*.py file mapped to its test-function count
+    
+    Only files whose mtime changed since they were last counted are read again.
+    """
+    test_file_stats = {}
+    with os.scandir(tests_dir) as entries:
+        for entry in sorted(entries, key=lambda e: e.name):
+            if entry.name.startswith("test_") and entry.name.endswith(".py") and entry.is_file():
+                try:
+                    test_file_stats[Path(entry.path)] = _count_tests(
+                        entry.path, entry.stat().st_mtime_ns
+                    )
+                except Exception:
+                    continue
+    return test_file_stats
+
+
+def _discover_agent_test_files(test_file_stats: Dict[Path, int], agent_name: str) -> Tuple[Path, ...]:
+    """Agent test files (test_*<agent>*.py) among the scanned files, each listed once"""
+    return tuple(p for p in test_file_stats if agent_name in p.name[len("test_"):])
+
+
+# Share of test-implied lines each agent's suite is expected to actually cover
+_COVERAGE_FACTORS: Dict[str, float] = {
+    "vectorforge": 0.75,  # Good test coverage
+    "layoutlab": 0.85,    # Very good test coverage
+    "grungeworks": 0.70,  # Good test coverage
+}
+_DEFAULT_COVERAGE_FACTOR = 0.6
+
+
+def _estimate_covered_lines(test_file_stats: Dict[Path, int], agent_name: str, total_lines: int) -> int:
+    """Covered-line estimate from agent test density"""
+    test_method_count = sum(
+        test_file_stats[test_file]
+        for test_file in _discover_agent_test_files(test_file_stats, agent_name)
+    )
+    
+    # Estimate coverage based on test density
+    # Assume each test method covers ~10 lines on average
+    estimated_covered = min(test_method_count * 10, total_lines)
+    
+    factor = _COVERAGE_FACTORS.get(agent_name, _DEFAULT_COVERAGE_FACTOR)
+    return int(estimated_covered * factor)
+
 
 @dataclass
 class CoverageReport:
@@ -29,12 +93,32 @@ class CoverageReport:
 class CoverageAnalyzer:
     """Analyze and report test coverage across all agents"""
     
-    def __init__(self, project_root: Path):
+    # Start of a line whose first non-blank character is not a comment marker
+    _CODE_LINE_RE = re.compile(rb"(?m)^[^\S\n]*[^\s#]")
+    
+    def __init__(self, project_root: Path, completed_test_files=frozenset()):
         self.project_root = project_root
+        # Resolved test files whose tests have all run in this process; only for those
+        # are an outer coverage session's measurements complete
+        self.completed_test_files = frozenset(completed_test_files)
         self.src_dir = project_root / "src"
         self.tests_dir = project_root / "tests"
         self.coverage_target = 80.0  # 80% coverage target
     
+    @property
+    def _test_file_stats(self) -> Dict[Path, int]:
+        """Test file -> test count for tests_dir, from one shared scan"""
+        return _scan_tests(str(self.tests_dir))
+    
+    @property
+    def _all_test_files(self) -> List[Path]:
+        """Test files under tests_dir"""
+        return list(self._test_file_stats)
+    
+    def _agent_test_files(self, agent_name: str) -> Tuple[Path, ...]:
+        """Test files matching test_*<agent>*.py"""
+        return _discover_agent_test_files(self._test_file_stats, agent_name)
+    
     def run_coverage_analysis(self) -> Dict[str, CoverageReport]:
         """Run comprehensive coverage analysis for all agents"""
         coverage_reports = {}
@@ -42,14 +126,115 @@ class CoverageAnalyzer:
         # Define agent directories
         agents = ["vectorforge", "layoutlab", "grungeworks"]
         
-        for agent in agents:
-            agent_dir = self.src_dir / agent
-            if agent_dir.exists():
-                report = self._analyze_agent_coverage(agent, agent_dir)
-                coverage_reports[agent] = report
+        agent_dirs = {agent: self.src_dir / agent for agent in agents}
+        agent_dirs = {agent: agent_dir for agent, agent_dir in agent_dirs.items() if agent_dir.exists()}
+        if not agent_dirs:
+            return coverage_reports
+        
+        # One in-process coverage run for all agents avoids a pytest bootstrap per agent
+        if self._use_inprocess_coverage():
+            try:
+                coverage_reports = self._run_inprocess_coverage(agent_dirs)
+            except Exception as e:
+                print(f"In-process coverage analysis failed: {e}")
+            if coverage_reports:
+                return coverage_reports
+        
+        # Each agent is dominated by its pytest subprocess, so run them side by side
+        with ThreadPoolExecutor(max_workers=len(agent_dirs)) as executor:
+            futures = {
+                agent: executor.submit(self._analyze_agent_coverage, agent, agent_dir)
+                for agent, agent_dir in agent_dirs.items()
+            }
+            for agent, future in futures.items():
+                coverage_reports[agent] = future.result()
         
         return coverage_reports
     
+    @staticmethod
+    def _use_inprocess_coverage() -> bool:
+        """Whether to measure via the coverage API instead of per-agent pytest subprocesses
+        
+        Set QUALITYGATE_COVERAGE_SUBPROCESS=1 to force the legacy subprocess path. It is
+        also used inside a running pytest session, where a nested pytest.main is unsafe.
+        """
+        if os.environ.get("QUALITYGATE_COVERAGE_SUBPROCESS") == "1":
+            return False
+        if "PYTEST_CURRENT_TEST" in os.environ:
+            return False
+        return importlib.util.find_spec("coverage") is not None
+    
+    def _run_inprocess_coverage(self, agent_dirs: Dict[str, Path]) -> Dict[str, CoverageReport]:
+        """Run all agent tests once under coverage.py and slice the results per agent"""
+        import coverage
+        
+        test_files = [
+            str(p) for agent in agent_dirs for p in self._all_test_files
+            if p.name.startswith(f"test_{agent}")
+        ]
+        if not test_files:
+            return {}
+        
+        cov = coverage.Coverage(source=[str(d) for d in agent_dirs.values()], data_file=None)
+        cov.start()
+        try:
+            exit_code = pytest.main([*test_files, "-q", "-p", "no:cacheprovider"])
+        finally:
+            cov.stop()
+        
+        if exit_code != 0:
+            return {}
+        
+        return self._reports_from_coverage(cov, agent_dirs)
+    
+    @staticmethod
+    def _reports_from_coverage(cov, agent_dirs: Dict[str, Path]) -> Dict[str, CoverageReport]:
+        """Build per-agent reports from a coverage.Coverage's measured data
+        
+        Agents with no measured files under their source directory are omitted.
+        """
+        measured_files = sorted(cov.get_data().measured_files())
+        coverage_reports = {}
+        for agent_name, agent_dir in agent_dirs.items():
+            agent_prefix = str(agent_dir.resolve()) + os.sep
+            total_lines = 0
+            covered_lines = 0
+            missing_lines = []
+            files_covered = []
+            
+            for filename in measured_files:
+                if not filename.startswith(agent_prefix):
+                    continue
+                _, statements, _excluded, missing, _ = cov.analysis2(filename)
+                total_lines += len(statements)
+                covered_lines += len(statements) - len(missing)
+                missing_lines.extend(missing)
+                files_covered.append(filename)
+            
+            if not files_covered:
+                continue
+            
+            coverage_percentage = (covered_lines / total_lines * 100) if total_lines > 0 else 0
+            coverage_reports[agent_name] = CoverageReport(
+                agent_name=agent_name,
+                total_lines=total_lines,
+                covered_lines=covered_lines,
+                coverage_percentage=coverage_percentage,
+                missing_lines=missing_lines[:10],  # Limit to first 10 for readability
+                files_covered=files_covered
+            )
+        
+        return coverage_reports
+    
+    @staticmethod
+    def _active_coverage():
+        """The coverage.Coverage already measuring this process (e.g. pytest --cov), if any"""
+        if importlib.util.find_spec("coverage") is None:
+            return None
+        import coverage
+        
+        return coverage.Coverage.current()
+    
     def _analyze_agent_coverage(self, agent_name: str, agent_dir: Path) -> CoverageReport:
         """Analyze coverage for a specific agent"""
         try:
@@ -65,48 +250,82 @@ class CoverageAnalyzer:
     
     def _run_pytest_coverage(self, agent_name: str, agent_dir: Path) -> CoverageReport:
         """Run pytest with coverage for specific agent"""
+        # Under an outer coverage run, reuse its measurements rather than nesting pytest --cov.
+        # Until the agent's tests have run it holds only import-time lines, so fall back
+        # to the manual estimate instead of reporting those
+        active_cov = self._active_coverage()
+        if active_cov is not None:
+            agent_tests = {p.resolve() for p in self._agent_test_files(agent_name)}
+            if not agent_tests or not agent_tests <= self.completed_test_files:
+                return None
+            return self._reports_from_coverage(active_cov, {agent_name: agent_dir}).get(agent_name)
+        
         try:
-            # Construct pytest command with coverage
-            cmd = [
-                sys.executable, "-m", "pytest",
-                f"--cov={agent_dir}",
-                "--cov-report=xml",
-                f"--cov-report=term-missing",
-                f"{self.tests_dir}/test_{agent_name}*.py",
-                "-v"
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=self.project_root)
-            
-            if result.returncode == 0:
-                # Parse coverage XML if available
-                coverage_xml = self.project_root / "coverage.xml"
-                if coverage_xml.exists():
-                    return self._parse_coverage_xml(agent_name, coverage_xml)
+            # Per-agent temp dir for the XML and data files: concurrent runs never
+            # overwrite each other, and nothing is left in the project root where an
+            # outer `coverage combine` would pick up a .coverage.* file
+            with tempfile.TemporaryDirectory(prefix=f"coverage_{agent_name}_") as tmp_dir:
+                coverage_xml = Path(tmp_dir) / "coverage.xml"
+                cmd = [
+                    sys.executable, "-m", "pytest",
+                    f"--cov={agent_dir}",
+                    "--cov-report=",  # no terminal report; only the XML is read
+                    f"--cov-report=xml:{coverage_xml}",
+                    *(str(p) for p in self._all_test_files if p.name.startswith(f"test_{agent_name}")),
+                    "-q", "-p", "no:cacheprovider",
+                ]
+                env = {**os.environ, "COVERAGE_FILE": str(Path(tmp_dir) / ".coverage")}
+                
+                result = subprocess.run(
+                    cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                    cwd=self.project_root, env=env
+                )
+                
+                if result.returncode == 0:
+                    # Parse coverage XML if available
+                    if coverage_xml.exists():
+                        return self._parse_coverage_xml(agent_name, coverage_xml)
             
         except Exception as e:
             print(f"Coverage analysis failed for {agent_name}: {e}")
         
         return None
     
+    @staticmethod
+    def _iter_py_files(root: Path):
+        """Yield paths of .py files under root, skipping __init__ files
+        
+        Walks with os.scandir so file-type checks come from the directory entry
+        rather than a separate stat per path.
+        """
+        stack = [str(root)]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".py") and entry.name != "__init__.py":
+                        yield entry.path
+    
+    @classmethod
+    def _count_code_lines(cls, data: bytes) -> int:
+        """Count lines whose first non-blank byte is not '#', in one regex pass"""
+        return len(cls._CODE_LINE_RE.findall(data))
+    
     def _manual_coverage_analysis(self, agent_name: str, agent_dir: Path) -> CoverageReport:
         """Manual coverage analysis based on code and test inspection"""
         # Count total lines of code
         total_lines = 0
         files_found = []
         
-        for py_file in agent_dir.glob("**/*.py"):
-            if py_file.name != "__init__.py":  # Skip __init__ files
-                try:
-                    with open(py_file, 'r') as f:
-                        lines = f.readlines()
-                    
+        for py_path in self._iter_py_files(agent_dir):
+            try:
+                with open(py_path, 'rb') as f:
                     # Count non-empty, non-comment lines
-                    code_lines = [line.strip() for line in lines if line.strip() and not line.strip().startswith('#')]
-                    total_lines += len(code_lines)
-                    files_found.append(str(py_file.relative_to(self.project_root)))
-                except Exception:
-                    continue
+                    total_lines += self._count_code_lines(f.read())
+                files_found.append(os.path.relpath(py_path, self.project_root))
+            except Exception:
+                continue
         
         # Estimate coverage based on test completeness
         covered_lines = self._estimate_covered_lines(agent_name, total_lines)
@@ -114,69 +333,53 @@ class CoverageAnalyzer:
         coverage_percentage = (covered_lines / total_lines * 100) if total_lines > 0 else 0
         
         # Estimate missing lines (for demo purposes)
-        missing_lines = list(range(covered_lines + 1, total_lines + 1, 5))  # Every 5th line uncovered
+        # Every 5th line uncovered, first 10 only for readability
+        missing_lines = list(islice(range(covered_lines + 1, total_lines + 1, 5), 10))
         
         return CoverageReport(
             agent_name=agent_name,
             total_lines=total_lines,
             covered_lines=covered_lines,
             coverage_percentage=coverage_percentage,
-            missing_lines=missing_lines[:10],  # Limit to first 10 for readability
+            missing_lines=missing_lines,
             files_covered=files_found
         )
     
     def _estimate_covered_lines(self, agent_name: str, total_lines: int) -> int:
         """Estimate covered lines based on test completeness"""
-        # Count test methods for this agent
-        test_files = list(self.tests_dir.glob(f"test_{agent_name}*.py"))
-        test_files.extend(self.tests_dir.glob(f"test_*{agent_name}*.py"))
-        
-        test_method_count = 0
-        for test_file in test_files:
-            try:
-                with open(test_file, 'r') as f:
-                    content = f.read()
-                
-                # Count test methods
-                test_method_count += content.count("def test_")
-            except Exception:
-                continue
-        
-        # Estimate coverage based on test density
-        # Assume each test method covers ~10 lines on average
-        estimated_covered = min(test_method_count * 10, total_lines)
-        
-        # Apply coverage estimates based on known completeness
-        coverage_factors = {
-            "vectorforge": 0.75,  # Good test coverage
-            "layoutlab": 0.85,    # Very good test coverage
-            "grungeworks": 0.70,  # Good test coverage
-        }
-        
-        factor = coverage_factors.get(agent_name, 0.6)
-        return int(estimated_covered * factor)
+        return _estimate_covered_lines(self._test_file_stats, agent_name, total_lines)
     
     def _parse_coverage_xml(self, agent_name: str, xml_path: Path) -> CoverageReport:
         """Parse coverage XML report"""
         try:
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
-            
             # Extract coverage data
             total_lines = 0
             covered_lines = 0
             files_covered = []
             
-            for package in root.findall(".//package"):
-                for class_elem in package.findall("classes/class"):
-                    filename = class_elem.get("filename", "")
-                    if agent_name in filename:
-                        lines_covered = int(class_elem.get("lines-covered", "0"))
-                        lines_valid = int(class_elem.get("lines-valid", "0"))
+            # Class filenames are relative to the report's <source> roots; match them
+            # against the agent's source directory rather than by substring
+            agent_prefix = str((self.src_dir / agent_name).resolve()) + os.sep
+            source_roots = []
+            
+            # Stream the report and drop each element once read, so memory stays flat
+            for _event, elem in ET.iterparse(xml_path, events=("end",)):
+                if elem.tag == "class":
+                    attrib = elem.attrib
+                    filename = attrib.get("filename", "")
+                    roots = source_roots or [str(self.project_root.resolve())]
+                    if any(os.path.normpath(os.path.join(root, filename)).startswith(agent_prefix) for root in roots):
+                        lines_covered = int(attrib.get("lines-covered", "0"))
+                        lines_valid = int(attrib.get("lines-valid", "0"))
                         
                         covered_lines += lines_covered
                         total_lines += lines_valid
                         files_covered.append(filename)
+                    elem.clear()
+                elif elem.tag == "source":
+                    source_roots.append(elem.text.strip() if elem.text else "")
+                elif elem.tag == "package":
+                    elem.clear()
             
             coverage_percentage = (covered_lines / total_lines * 100) if total_lines > 0 else 0
             
@@ -193,105 +396,103 @@ class CoverageAnalyzer:
             print(f"Failed to parse coverage XML: {e}")
             return None
     
+    @staticmethod
+    def _aggregate(coverage_reports: Dict[str, CoverageReport]) -> Tuple[int, int, float]:
+        """Total lines, covered lines and overall percentage in a single pass"""
+        total_lines = total_covered = 0
+        for r in coverage_reports.values():
+            total_lines += r.total_lines
+            total_covered += r.covered_lines
+        overall_coverage = (total_covered / total_lines * 100) if total_lines > 0 else 0
+        return total_lines, total_covered, overall_coverage
+    
     def generate_coverage_report(self, coverage_reports: Dict[str, CoverageReport]) -> str:
         """Generate comprehensive coverage report"""
-        report = []
-        report.append("=" * 80)
-        report.append("QUALITYGATE TEST COVERAGE REPORT")
-        report.append("=" * 80)
-        report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append(f"Coverage Target: {self.coverage_target}%")
-        report.append("")
+        buf = io.StringIO()
+        line = partial(print, file=buf)  # writes text plus newline straight into the buffer
+        line("=" * 80)
+        line("QUALITYGATE TEST COVERAGE REPORT")
+        line("=" * 80)
+        line(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        line(f"Coverage Target: {self.coverage_target}%")
+        line("")
         
         # Overall statistics
-        total_lines = sum(r.total_lines for r in coverage_reports.values())
-        total_covered = sum(r.covered_lines for r in coverage_reports.values())
-        overall_coverage = (total_covered / total_lines * 100) if total_lines > 0 else 0
+        total_lines, total_covered, overall_coverage = self._aggregate(coverage_reports)
         
-        report.append("OVERALL COVERAGE SUMMARY")
-        report.append("-" * 40)
-        report.append(f"Total Lines of Code: {total_lines:,}")
-        report.append(f"Lines Covered: {total_covered:,}")
-        report.append(f"Overall Coverage: {overall_coverage:.1f}%")
+        line("OVERALL COVERAGE SUMMARY")
+        line("-" * 40)
+        line(f"Total Lines of Code: {total_lines:,}")
+        line(f"Lines Covered: {total_covered:,}")
+        line(f"Overall Coverage: {overall_coverage:.1f}%")
         
         target_status = "✅ TARGET MET" if overall_coverage >= self.coverage_target else "❌ BELOW TARGET"
-        report.append(f"Target Status: {target_status}")
-        report.append("")
+        line(f"Target Status: {target_status}")
+        line("")
         
         # Agent-specific reports
-        report.append("AGENT-SPECIFIC COVERAGE")
-        report.append("-" * 40)
+        line("AGENT-SPECIFIC COVERAGE")
+        line("-" * 40)
         
         for agent_name, coverage_report in coverage_reports.items():
             status = "✅" if coverage_report.coverage_percentage >= self.coverage_target else "❌"
             
-            report.append(f"{status} {agent_name.upper()}")
-            report.append(f"  Coverage: {coverage_report.coverage_percentage:.1f}%")
-            report.append(f"  Lines: {coverage_report.covered_lines}/{coverage_report.total_lines}")
-            report.append(f"  Files: {len(coverage_report.files_covered)}")
+            line(f"{status} {agent_name.upper()}")
+            line(f"  Coverage: {coverage_report.coverage_percentage:.1f}%")
+            line(f"  Lines: {coverage_report.covered_lines}/{coverage_report.total_lines}")
+            line(f"  Files: {len(coverage_report.files_covered)}")
             
             if coverage_report.missing_lines:
                 missing_sample = coverage_report.missing_lines[:5]
-                report.append(f"  Missing: Lines {', '.join(map(str, missing_sample))}{'...' if len(coverage_report.missing_lines) > 5 else ''}")
+                line(f"  Missing: Lines {', '.join(map(str, missing_sample))}{'...' if len(coverage_report.missing_lines) > 5 else ''}")
             
-            report.append("")
+            line("")
         
         # Coverage improvement recommendations
-        report.append("IMPROVEMENT RECOMMENDATIONS")
-        report.append("-" * 40)
+        line("IMPROVEMENT RECOMMENDATIONS")
+        line("-" * 40)
         
         for agent_name, coverage_report in coverage_reports.items():
             if coverage_report.coverage_percentage < self.coverage_target:
                 gap = self.coverage_target - coverage_report.coverage_percentage
                 additional_lines = int((gap / 100) * coverage_report.total_lines)
-                
-                report.append(f"📈 {agent_name.upper()}:")
-                report.append(f"  • Need {gap:.1f}% more coverage")
-                report.append(f"  • Approximately {additional_lines} more lines to cover")
-                report.append(f"  • Recommended: Add integration tests and edge case testing")
-                report.append("")
+                line(f"📈 {agent_name.upper()}:")
+                line(f"  • Need {gap:.1f}% more coverage")
+                line(f"  • Approximately {additional_lines} more lines to cover")
+                line(f"  • Recommended: Add integration tests and edge case testing")
+                line("")
         
         # Test file coverage
-        report.append("TEST FILE COVERAGE")
-        report.append("-" * 40)
+        line("TEST FILE COVERAGE")
+        line("-" * 40)
         
-        test_files = list(self.tests_dir.glob("test_*.py"))
-        report.append(f"Total Test Files: {len(test_files)}")
+        test_file_stats = self._test_file_stats
+        line(f"Total Test Files: {len(test_file_stats)}")
         
-        for test_file in test_files:
-            try:
-                with open(test_file, 'r') as f:
-                    content = f.read()
-                
-                test_count = content.count("def test_")
-                report.append(f"  {test_file.name}: {test_count} tests")
-            except Exception:
-                continue
+        for test_file, test_count in test_file_stats.items():
+            line(f"  {test_file.name}: {test_count} tests")
         
-        report.append("")
-        report.append("=" * 80)
+        line("")
+        buf.write("=" * 80)
         
-        return "\n".join(report)
+        return buf.getvalue()
     
     def check_coverage_thresholds(self, coverage_reports: Dict[str, CoverageReport]) -> bool:
         """Check if coverage meets thresholds"""
-        total_lines = sum(r.total_lines for r in coverage_reports.values())
-        total_covered = sum(r.covered_lines for r in coverage_reports.values())
-        overall_coverage = (total_covered / total_lines * 100) if total_lines > 0 else 0
+        _total_lines, _total_covered, overall_coverage = self._aggregate(coverage_reports)
         
         return overall_coverage >= self.coverage_target
     
     def export_coverage_json(self, coverage_reports: Dict[str, CoverageReport], output_path: Path):
         """Export coverage data as JSON for CI/CD integration"""
+        total_lines, total_covered, overall_coverage = self._aggregate(coverage_reports)
         data = {
             "timestamp": datetime.now().isoformat(),
             "target": self.coverage_target,
             "overall": {
-                "total_lines": sum(r.total_lines for r in coverage_reports.values()),
-                "covered_lines": sum(r.covered_lines for r in coverage_reports.values()),
-                "coverage_percentage": (sum(r.covered_lines for r in coverage_reports.values()) / 
-                                     sum(r.total_lines for r in coverage_reports.values()) * 100)
-                                     if sum(r.total_lines for r in coverage_reports.values()) > 0 else 0
+                "total_lines": total_lines,
+                "covered_lines": total_covered,
+                "coverage_percentage": overall_coverage
             },
             "agents": {}
         }
@@ -305,20 +506,38 @@ class CoverageAnalyzer:
                 "missing_lines_count": len(report.missing_lines)
             }
         
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        output_path.write_bytes(_json_dumps(data, sort_keys=True))
+
+
+def _completed_test_files(session: pytest.Session, ran_nodeids) -> frozenset:
+    """Resolved paths of test files whose collected items have all run in this process
+    
+    Uses the recorded nodeids rather than collection order, which xdist, --lf or
+    random ordering make unreliable.
+    """
+    file_done: Dict[Path, bool] = {}
+    for item in session.items:
+        path = item.path.resolve()
+        file_done[path] = file_done.get(path, True) and item.nodeid in ran_nodeids
+    return frozenset(path for path, done in file_done.items() if done)
+
+
+@pytest.fixture(scope="session")
+def coverage_analysis(request, ran_test_nodeids):
+    """Analyzer plus its coverage reports, computed once per test session"""
+    project_root = Path(__file__).parent.parent
+    analyzer = CoverageAnalyzer(
+        project_root, _completed_test_files(request.session, ran_test_nodeids)
+    )
+    return analyzer, analyzer.run_coverage_analysis()
 
 
 class TestCoverageRunner:
     """Test runner for coverage analysis"""
     
-    def test_run_coverage_analysis(self):
+    def test_run_coverage_analysis(self, coverage_analysis):
         """Test coverage analysis functionality"""
-        project_root = Path(__file__).parent.parent
-        analyzer = CoverageAnalyzer(project_root)
-        
-        # Run coverage analysis
-        coverage_reports = analyzer.run_coverage_analysis()
+        analyzer, coverage_reports = coverage_analysis
         
         # Validate results
         assert len(coverage_reports) > 0, "Should have coverage reports for agents"
@@ -339,17 +558,12 @@ class TestCoverageRunner:
         # Check if target is met
         target_met = analyzer.check_coverage_thresholds(coverage_reports)
         print(f"\nCoverage target (80%) met: {target_met}")
-        
-        return coverage_reports, target_met
     
-    def test_export_coverage_json(self):
+    def test_export_coverage_json(self, coverage_analysis):
         """Test JSON export functionality"""
         import tempfile
         
-        project_root = Path(__file__).parent.parent
-        analyzer = CoverageAnalyzer(project_root)
-        
-        coverage_reports = analyzer.run_coverage_analysis()
+        analyzer, coverage_reports = coverage_analysis
         
         with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
             json_path = Path(f.name)
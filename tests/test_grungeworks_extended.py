@@ -5,15 +5,114 @@ image processing pipeline validation, and visual quality assurance.
 
 import io
 import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Tuple, Union
 import pytest
 import numpy as np
-from PIL import Image, ImageStat
+from PIL import Image, ImageChops
 from unittest.mock import Mock, patch
 import os
 
-from .fixtures import TestFixtures
+from .fixtures import TestFixtures, _json_dumps
+
+try:
+    import cv2
+    from src.grungeworks import GrungeWorksAgent
+    from src.grungeworks.filters import GaussianBlurFilter, JPEGArtifactFilter, SkewPerspectiveFilter
+    GRUNGEWORKS_AVAILABLE = True
+except ImportError:
+    GRUNGEWORKS_AVAILABLE = False
+
+pytestmark = pytest.mark.skipif(not GRUNGEWORKS_AVAILABLE, reason="GrungeWorks agent not available")
+
+
+# Blank page for edge-artifact checks, filled once; hand out .copy() so tests never share it
+_WHITE_200 = Image.new('RGB', (200, 200), 'white')
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write compact JSON"""
+    path.write_bytes(_json_dumps(data, indent=False))
+
+
+def _mock_image(width: int = 400, height: int = 300) -> Image.Image:
+    """Mock page render of the given size, a private copy the test may modify"""
+    return TestFixtures.create_mock_png_image(width, height)
+
+
+@lru_cache(maxsize=None)
+def _mock_array(width: int = 400, height: int = 300) -> np.ndarray:
+    """Read-only pixel array of _mock_image, converted once per size"""
+    arr = np.asarray(_mock_image(width, height))
+    arr.setflags(write=False)
+    return arr
+
+
+def _image_quality(image: Union[Image.Image, np.ndarray]) -> float:
+    """Mean per-band pixel standard deviation (higher = more detail)"""
+    # Same population stddev as ImageStat.Stat, reduced in C over the pixel buffer
+    arr = np.asarray(image)
+    return float(arr.std(axis=(0, 1)).mean()) if arr.ndim == 3 else float(arr.std())
+
+
+def _ssim(gray1: np.ndarray, gray2: np.ndarray, win_size: int = 7) -> float:
+    """Mean SSIM of two uint8 grayscale arrays
+    
+    Same result as skimage.metrics.structural_similarity with its defaults (uniform
+    7x7 window, sample covariance, data range 255), with the window sums done by
+    OpenCV's box filter instead of skimage's Python-level dispatch.
+    """
+    x = np.asarray(gray1, dtype=np.float64)
+    y = np.asarray(gray2, dtype=np.float64)
+    
+    def window_mean(arr: np.ndarray) -> np.ndarray:
+        return cv2.boxFilter(arr, -1, (win_size, win_size), borderType=cv2.BORDER_REFLECT)
+    
+    ux, uy = window_mean(x), window_mean(y)
+    uxx, uyy, uxy = window_mean(x * x), window_mean(y * y), window_mean(x * y)
+    
+    # Unbiased (sample) variances, as skimage uses by default
+    n = win_size * win_size
+    cov_norm = n / (n - 1)
+    vx = cov_norm * (uxx - ux * ux)
+    vy = cov_norm * (uyy - uy * uy)
+    vxy = cov_norm * (uxy - ux * uy)
+    
+    c1 = (0.01 * 255) ** 2
+    c2 = (0.03 * 255) ** 2
+    ssim_map = ((2 * ux * uy + c1) * (2 * vxy + c2)) / ((ux * ux + uy * uy + c1) * (vx + vy + c2))
+    
+    # Ignore the border where the window overhangs the image
+    pad = (win_size - 1) // 2
+    return float(ssim_map[pad:-pad, pad:-pad].mean())
+
+
+def _images_equal(img1: Image.Image, img2: Image.Image) -> bool:
+    """Whether two same-mode images are pixel-identical, without materializing arrays"""
+    return ImageChops.difference(img1, img2).getbbox() is None
+
+
+def _count_differences(img1: Union[Image.Image, np.ndarray], img2: Union[Image.Image, np.ndarray]) -> int:
+    """Count pixels that differ in any band between two images"""
+    # asarray avoids copying the pixel buffers; count_nonzero reduces the mask in C
+    arr1 = np.asarray(img1)
+    arr2 = np.asarray(img2)
+    if arr1.ndim == 3:
+        return int(np.count_nonzero(np.any(arr1 != arr2, axis=-1)))
+    return int(np.count_nonzero(arr1 != arr2))
+
+
+@pytest.fixture(scope="session")
+def ref_gray(tmp_path_factory):
+    """Grayscale default mock page as a read-only memmap, shared by image-comparison tests"""
+    path = tmp_path_factory.mktemp("ref_gray") / "ref.npy"
+    gray = np.asarray(TestFixtures.create_mock_png_image(400, 300).convert('L'))
+    out = np.lib.format.open_memmap(path, mode="w+", dtype=gray.dtype, shape=gray.shape)
+    out[:] = gray
+    out.flush()
+    del out
+    return np.load(path, mmap_mode="r")
 
 
 class TestNoiseFilterIndividual:
@@ -21,19 +120,15 @@ class TestNoiseFilterIndividual:
     
     def setup_method(self):
         """Set up test image for each test"""
-        self.test_image = TestFixtures.create_mock_png_image(400, 300)
+        self.test_image = _mock_image(400, 300)
+        # Helpers that work on arrays take this instead of re-converting the original
+        self.test_image_arr = _mock_array(400, 300)
         
-        # Set deterministic seed for reproducible tests
-        np.random.seed(42)
-        os.environ["NOISE_SEED"] = "42"
+        # Per-test generator keeps results reproducible without touching global NumPy state
+        self.rng = np.random.default_rng(int(os.environ.get("NOISE_SEED", "42")))
     
     def test_gaussian_blur_filter(self):
         """Test Gaussian blur filter functionality"""
-        try:
-            from src.grungeworks.filters import GaussianBlurFilter
-        except ImportError:
-            pytest.skip("GrungeWorks filters not available")
-        
         original_image = self.test_image.copy()
         blur_filter = GaussianBlurFilter(sigma=0.5)
         
@@ -51,11 +146,6 @@ class TestNoiseFilterIndividual:
     
     def test_jpeg_artifact_filter(self):
         """Test JPEG compression artifact filter"""
-        try:
-            from src.grungeworks.filters import JPEGArtifactFilter
-        except ImportError:
-            pytest.skip("GrungeWorks filters not available")
-        
         original_image = self.test_image.copy()
         jpeg_filter = JPEGArtifactFilter(quality=70)
         
@@ -67,19 +157,14 @@ class TestNoiseFilterIndividual:
         assert compressed_image.mode == original_image.mode, "Image mode should be preserved"
         
         # Verify compression artifacts (slight quality degradation)
-        original_quality = self._calculate_image_quality(original_image)
+        original_quality = self._calculate_image_quality(self.test_image_arr)
         compressed_quality = self._calculate_image_quality(compressed_image)
         assert compressed_quality <= original_quality, "Compression should reduce quality"
     
     def test_skew_perspective_filter(self):
         """Test skew and perspective warp filter"""
-        try:
-            from src.grungeworks.filters import SkewPerspectiveFilter
-        except ImportError:
-            pytest.skip("GrungeWorks filters not available")
-        
         original_image = self.test_image.copy()
-        skew_filter = SkewPerspectiveFilter(max_skew=1.0, max_perspective=0.01)
+        skew_filter = SkewPerspectiveFilter(max_skew=1.0, max_perspective=0.01, rng=self.rng)
         
         # Apply filter
         warped_image = skew_filter.apply(original_image)
@@ -89,38 +174,25 @@ class TestNoiseFilterIndividual:
         assert warped_image.mode == original_image.mode, "Image mode should be preserved"
         
         # Verify transformation occurred (pixel differences)
-        diff_count = self._count_pixel_differences(original_image, warped_image)
+        diff_count = self._count_pixel_differences(self.test_image_arr, warped_image)
         assert diff_count > 0, "Skew/perspective should change pixels"
     
     def test_filter_deterministic_with_seed(self):
         """Test that filters produce deterministic results with same seed"""
-        try:
-            from src.grungeworks.filters import SkewPerspectiveFilter
-        except ImportError:
-            pytest.skip("GrungeWorks filters not available")
-        
         original_image = self.test_image.copy()
         
         # Apply filter twice with same seed
-        np.random.seed(123)
-        filter1 = SkewPerspectiveFilter(max_skew=2.0, max_perspective=0.02)
+        filter1 = SkewPerspectiveFilter(max_skew=2.0, max_perspective=0.02, rng=np.random.default_rng(123))
         result1 = filter1.apply(original_image)
         
-        np.random.seed(123)
-        filter2 = SkewPerspectiveFilter(max_skew=2.0, max_perspective=0.02)
+        filter2 = SkewPerspectiveFilter(max_skew=2.0, max_perspective=0.02, rng=np.random.default_rng(123))
         result2 = filter2.apply(original_image)
         
         # Results should be identical
-        diff_count = self._count_pixel_differences(result1, result2)
-        assert diff_count == 0, "Same seed should produce identical results"
+        assert _images_equal(result1, result2), "Same seed should produce identical results"
     
     def test_filter_parameter_validation(self):
         """Test filter parameter validation"""
-        try:
-            from src.grungeworks.filters import GaussianBlurFilter, JPEGArtifactFilter
-        except ImportError:
-            pytest.skip("GrungeWorks filters not available")
-        
         # Test Gaussian blur with invalid sigma
         blur_filter = GaussianBlurFilter(sigma=-1.0)
         result = blur_filter.apply(self.test_image)
@@ -135,118 +207,94 @@ class TestNoiseFilterIndividual:
     
     def _detect_edges(self, image: Image.Image) -> int:
         """Simple edge detection to measure image sharpness"""
-        # Convert to grayscale and detect edges
-        gray = image.convert('L')
-        pixels = np.array(gray)
-        
-        # Simple edge detection using differences
-        edge_x = np.abs(np.diff(pixels, axis=1))
-        edge_y = np.abs(np.diff(pixels, axis=0))
-        
-        # Count significant edges
+        # Convert to grayscale; widen so differences don't wrap around in uint8
+        pixels = np.asarray(image.convert('L'), dtype=np.int16)
         threshold = 10
-        edge_count = np.sum(edge_x > threshold) + np.sum(edge_y > threshold)
+        
+        # Simple edge detection using differences, taking |diff| in place
+        edge_count = 0
+        for axis in (1, 0):
+            diff = np.diff(pixels, axis=axis)
+            np.abs(diff, out=diff)
+            edge_count += np.count_nonzero(diff > threshold)
         return edge_count
     
-    def _calculate_image_quality(self, image: Image.Image) -> float:
+    def _calculate_image_quality(self, image: Union[Image.Image, np.ndarray]) -> float:
         """Calculate simple image quality metric"""
         # Use standard deviation as quality metric
-        stat = ImageStat.Stat(image)
-        return np.mean(stat.stddev)  # Higher stddev = more detail/quality
+        return _image_quality(image)  # Higher stddev = more detail/quality
     
-    def _count_pixel_differences(self, img1: Image.Image, img2: Image.Image) -> int:
+    def _count_pixel_differences(self, img1: Union[Image.Image, np.ndarray],
+                                 img2: Union[Image.Image, np.ndarray]) -> int:
         """Count number of differing pixels between two images"""
-        arr1 = np.array(img1)
-        arr2 = np.array(img2)
-        return np.sum(arr1 != arr2)
+        return _count_differences(img1, img2)
 
 
 class TestNoisePipeline:
     """Test noise pipeline and noise level presets"""
     
-    def setup_method(self):
-        """Set up test environment"""
-        np.random.seed(42)
-        os.environ["NOISE_SEED"] = "42"
-    
-    def test_noise_level_progression(self):
-        """Test that higher noise levels add more artifacts"""
-        try:
-            from src.grungeworks import GrungeWorksAgent
-        except ImportError:
-            pytest.skip("GrungeWorks agent not available")
-        
-        original_image = TestFixtures.create_mock_png_image()
+    @pytest.fixture(scope="class")
+    @classmethod
+    def pipeline_quality(cls):
+        """Quality score per noise level, each level processed at most once per class"""
+        original_image = _mock_image()
         agent = GrungeWorksAgent(debug=False)
         
-        # Test different noise levels
-        quality_scores = {}
-        for noise_level in [0, 1, 2, 3]:
+        @lru_cache(maxsize=None)
+        def quality(noise_level: int) -> float:
             processed = agent._apply_noise_pipeline(original_image, noise_level)
-            quality = self._calculate_image_quality(processed)
-            quality_scores[noise_level] = quality
+            return cls._calculate_image_quality(processed)
         
+        return quality
+    
+    @pytest.mark.parametrize("noise_level", [1, 2, 3])
+    def test_noise_level_progression(self, pipeline_quality, noise_level: int):
+        """Test that higher noise levels add more artifacts"""
         # Quality should generally decrease with higher noise levels
-        assert quality_scores[0] >= quality_scores[1], "Level 1 should have some degradation"
-        assert quality_scores[1] >= quality_scores[2], "Level 2 should have more degradation"
-        assert quality_scores[2] >= quality_scores[3], "Level 3 should have most degradation"
+        assert pipeline_quality(noise_level - 1) >= pipeline_quality(noise_level), \
+            f"Level {noise_level} should degrade more than level {noise_level - 1}"
     
     def test_noise_level_zero_passthrough(self):
         """Test that noise level 0 produces minimal changes"""
-        try:
-            from src.grungeworks import GrungeWorksAgent
-        except ImportError:
-            pytest.skip("GrungeWorks agent not available")
-        
-        original_image = TestFixtures.create_mock_png_image()
+        original_image = _mock_image()
         agent = GrungeWorksAgent(debug=False)
         
         # Level 0 should be passthrough
         processed = agent._apply_noise_pipeline(original_image, 0)
         
         # Should be identical or very similar
-        diff_count = self._count_pixel_differences(original_image, processed)
-        assert diff_count == 0, "Noise level 0 should not modify image"
+        assert _images_equal(original_image, processed), "Noise level 0 should not modify image"
     
     def test_debug_mode_output(self):
         """Test that debug mode saves intermediate images"""
-        try:
-            from src.grungeworks import GrungeWorksAgent
-        except ImportError:
-            pytest.skip("GrungeWorks agent not available")
-        
         with tempfile.TemporaryDirectory() as temp_dir:
             # Create test image with filename
             test_image_path = Path(temp_dir) / "test_image.png"
-            test_image = TestFixtures.create_mock_png_image()
+            test_image = _mock_image()
             test_image.save(test_image_path)
             
-            # Load image for processing
-            img_with_filename = Image.open(test_image_path)
-            
             agent = GrungeWorksAgent(debug=True)
             
-            # Process with debug mode
-            try:
-                processed = agent._apply_noise_pipeline(img_with_filename, 2)
-                
-                # Check for debug files (would be created in real implementation)
-                debug_files = list(Path(temp_dir).glob("*debug*.png"))
-                # Note: This test validates the debug logic exists
-                # Actual debug file creation depends on implementation
+            # Load image for processing; the with block releases the file handle
+            with Image.open(test_image_path) as img_with_filename:
+                img_with_filename.load()
                 
-            except Exception:
-                # Debug mode might not be fully implemented
-                pass
+                # Process with debug mode
+                try:
+                    processed = agent._apply_noise_pipeline(img_with_filename, 2)
+                    
+                    # Check for debug files (would be created in real implementation)
+                    debug_files = list(Path(temp_dir).glob("*debug*.png"))
+                    # Note: This test validates the debug logic exists
+                    # Actual debug file creation depends on implementation
+                    
+                except Exception:
+                    # Debug mode might not be fully implemented
+                    pass
     
     def test_pipeline_filter_order(self):
         """Test that filters are applied in correct order"""
-        try:
-            from src.grungeworks import GrungeWorksAgent
-        except ImportError:
-            pytest.skip("GrungeWorks agent not available")
-        
-        original_image = TestFixtures.create_mock_png_image()
+        original_image = _mock_image()
         agent = GrungeWorksAgent(debug=False)
         
         # Test noise level 2 (has multiple filters)
@@ -257,78 +305,56 @@ class TestNoisePipeline:
         assert processed.mode == original_image.mode
         
         # Verify some processing occurred
-        diff_count = self._count_pixel_differences(original_image, processed)
-        assert diff_count > 0, "Pipeline should modify the image"
+        assert not _images_equal(original_image, processed), "Pipeline should modify the image"
     
-    def _calculate_image_quality(self, image: Image.Image) -> float:
+    @staticmethod
+    def _calculate_image_quality(image: Image.Image) -> float:
         """Calculate image quality metric"""
-        stat = ImageStat.Stat(image)
-        return np.mean(stat.stddev)
-    
-    def _count_pixel_differences(self, img1: Image.Image, img2: Image.Image) -> int:
-        """Count differing pixels"""
-        arr1 = np.array(img1)
-        arr2 = np.array(img2)
-        return np.sum(arr1 != arr2)
+        return _image_quality(image)
 
 
 class TestPDFProcessing:
     """Test PDF to PNG conversion functionality"""
     
-    def test_pdf_conversion_mock(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def pdf_fixture(cls, tmp_path_factory) -> Tuple[Path, Path]:
+        """Mock PDF written once per class, plus a PNG output path beside it"""
+        temp_dir = tmp_path_factory.mktemp("pdf")
+        pdf_path = temp_dir / "test.pdf"
+        pdf_path.write_bytes(TestFixtures.create_mock_pdf_bytes())
+        return pdf_path, temp_dir / "test.png"
+    
+    def test_pdf_conversion_mock(self, pdf_fixture):
         """Test PDF conversion with mock data"""
-        try:
-            from src.grungeworks import GrungeWorksAgent
-        except ImportError:
-            pytest.skip("GrungeWorks agent not available")
+        pdf_path, png_path = pdf_fixture
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create mock PDF
-            pdf_path = Path(temp_dir) / "test.pdf"
-            pdf_bytes = TestFixtures.create_mock_pdf_bytes()
-            with open(pdf_path, 'wb') as f:
-                f.write(pdf_bytes)
-            
-            png_path = Path(temp_dir) / "test.png"
-            
-            agent = GrungeWorksAgent()
-            
-            # This would test the actual conversion if libraries are available
-            # For now, verify the method exists and handles errors gracefully
-            try:
-                result = agent.convert_pdf_to_png(str(pdf_path), str(png_path))
-                if result:
-                    assert png_path.exists(), "PNG should be created on success"
-            except Exception:
-                # Expected if PDF libraries not available
-                pass
+        agent = GrungeWorksAgent()
+        
+        # This would test the actual conversion if libraries are available
+        # For now, verify the method exists and handles errors gracefully
+        try:
+            result = agent.convert_pdf_to_png(str(pdf_path), str(png_path))
+            if result:
+                assert png_path.exists(), "PNG should be created on success"
+        except Exception:
+            # Expected if PDF libraries not available
+            pass
     
-    def test_pdf_dpi_parameter(self):
+    def test_pdf_dpi_parameter(self, pdf_fixture):
         """Test PDF conversion with different DPI settings"""
-        try:
-            from src.grungeworks import GrungeWorksAgent
-        except ImportError:
-            pytest.skip("GrungeWorks agent not available")
+        pdf_path, png_path = pdf_fixture
         
         agent = GrungeWorksAgent()
         
-        # Test that DPI parameter is accepted
-        with tempfile.TemporaryDirectory() as temp_dir:
-            pdf_path = Path(temp_dir) / "test.pdf"
-            png_path = Path(temp_dir) / "test.png"
-            
-            # Create mock PDF
-            with open(pdf_path, 'wb') as f:
-                f.write(TestFixtures.create_mock_pdf_bytes())
-            
-            # Test different DPI values
-            for dpi in [150, 300, 600]:
-                try:
-                    result = agent.convert_pdf_to_png(str(pdf_path), str(png_path), dpi=dpi)
-                    # Method should accept DPI parameter without error
-                except Exception:
-                    # Expected if conversion libraries not available
-                    pass
+        # Test different DPI values
+        for dpi in [150, 300, 600]:
+            try:
+                result = agent.convert_pdf_to_png(str(pdf_path), str(png_path), dpi=dpi)
+                # Method should accept DPI parameter without error
+            except Exception:
+                # Expected if conversion libraries not available
+                pass
 
 
 class TestCoordinateAlignment:
@@ -336,11 +362,6 @@ class TestCoordinateAlignment:
     
     def test_coordinate_verification_basic(self):
         """Test basic coordinate alignment verification"""
-        try:
-            from src.grungeworks import GrungeWorksAgent
-        except ImportError:
-            pytest.skip("GrungeWorks agent not available")
-        
         with tempfile.TemporaryDirectory() as temp_dir:
             # Create test files
             json_path = Path(temp_dir) / "test.json"
@@ -348,12 +369,10 @@ class TestCoordinateAlignment:
             
             # Create test JSON
             test_data = TestFixtures.get_mock_page_data()
-            with open(json_path, 'w') as f:
-                import json
-                json.dump(test_data, f)
+            _write_json(json_path, test_data)
             
             # Create test PNG
-            test_image = TestFixtures.create_mock_png_image(800, 600)  # 300 DPI A4-ish
+            test_image = _mock_image(800, 600)  # 300 DPI A4-ish
             test_image.save(png_path)
             
             agent = GrungeWorksAgent()
@@ -366,11 +385,6 @@ class TestCoordinateAlignment:
     
     def test_coordinate_bounds_checking(self):
         """Test that coordinates are checked against image bounds"""
-        try:
-            from src.grungeworks import GrungeWorksAgent
-        except ImportError:
-            pytest.skip("GrungeWorks agent not available")
-        
         with tempfile.TemporaryDirectory() as temp_dir:
             # Create test files with out-of-bounds coordinates
             json_path = Path(temp_dir) / "test.json"
@@ -388,12 +402,10 @@ class TestCoordinateAlignment:
                 "parameters": {}
             })
             
-            with open(json_path, 'w') as f:
-                import json
-                json.dump(test_data, f)
+            _write_json(json_path, test_data)
             
             # Create small PNG
-            small_image = TestFixtures.create_mock_png_image(100, 100)
+            small_image = _mock_image(100, 100)
             small_image.save(png_path)
             
             agent = GrungeWorksAgent()
@@ -406,27 +418,18 @@ class TestCoordinateAlignment:
 class TestVisualQuality:
     """Test visual quality and regression testing"""
     
-    def test_structural_similarity_preservation(self):
+    def test_structural_similarity_preservation(self, ref_gray):
         """Test that noise doesn't destroy too much structure"""
-        try:
-            from skimage.metrics import structural_similarity as ssim
-            from src.grungeworks import GrungeWorksAgent
-        except ImportError:
-            pytest.skip("Required libraries not available")
-        
-        original_image = TestFixtures.create_mock_png_image()
+        original_image = _mock_image()
         agent = GrungeWorksAgent()
         
         # Test different noise levels
         for noise_level in [1, 2, 3]:
             processed = agent._apply_noise_pipeline(original_image, noise_level)
-            
-            # Convert to grayscale for SSIM
-            orig_gray = np.array(original_image.convert('L'))
             proc_gray = np.array(processed.convert('L'))
             
-            # Calculate SSIM
-            ssim_score = ssim(orig_gray, proc_gray)
+            # Calculate SSIM against the shared grayscale original
+            ssim_score = _ssim(ref_gray, proc_gray)
             
             # SSIM should be reasonable (>0.5 even for highest noise)
             min_ssim = 0.8 if noise_level == 1 else 0.6 if noise_level == 2 else 0.4
@@ -434,23 +437,18 @@ class TestVisualQuality:
     
     def test_histogram_preservation(self):
         """Test that overall image histogram characteristics are preserved"""
-        try:
-            from src.grungeworks import GrungeWorksAgent
-        except ImportError:
-            pytest.skip("GrungeWorks agent not available")
-        
-        original_image = TestFixtures.create_mock_png_image()
+        original_image = _mock_image()
         agent = GrungeWorksAgent()
         
         # Get original histogram
-        orig_hist = original_image.histogram()
+        orig_hist = np.asarray(original_image.histogram(), dtype=np.int64)
         
         # Process with moderate noise
         processed = agent._apply_noise_pipeline(original_image, 2)
-        proc_hist = processed.histogram()
+        proc_hist = np.asarray(processed.histogram(), dtype=np.int64)
         
         # Histograms should be similar (not too different)
-        hist_diff = sum(abs(o - p) for o, p in zip(orig_hist, proc_hist))
+        hist_diff = int(np.abs(orig_hist - proc_hist).sum())
         total_pixels = original_image.size[0] * original_image.size[1]
         
         # Difference should be less than 50% of total pixels
@@ -458,13 +456,8 @@ class TestVisualQuality:
     
     def test_no_artifacts_at_edges(self):
         """Test that filters don't create artifacts at image edges"""
-        try:
-            from src.grungeworks import GrungeWorksAgent
-        except ImportError:
-            pytest.skip("GrungeWorks agent not available")
-        
-        # Create image with white border
-        original_image = Image.new('RGB', (200, 200), 'white')
+        # Image with white border; the pipeline copies its input, so the shared one is safe
+        original_image = _WHITE_200.copy()
         agent = GrungeWorksAgent()
         
         # Process with all noise levels
@@ -472,24 +465,20 @@ class TestVisualQuality:
             processed = agent._apply_noise_pipeline(original_image, noise_level)
             
             # Check that edges are still reasonable (not black or too distorted)
-            edge_pixels = []
-            width, height = processed.size
-            
-            # Sample edge pixels
-            for x in [0, width-1]:
-                for y in range(0, height, 10):
-                    if 0 <= y < height:
-                        edge_pixels.append(processed.getpixel((x, y)))
-            
-            for y in [0, height-1]:
-                for x in range(0, width, 10):
-                    if 0 <= x < width:
-                        edge_pixels.append(processed.getpixel((x, y)))
+            # Sample every 10th pixel along each border with two strided slices
+            arr = np.asarray(processed)
+            top_bottom = arr[[0, -1], ::10]
+            left_right = arr[::10, [0, -1]]
+            edge_pixels = np.concatenate([
+                top_bottom.reshape(-1, *arr.shape[2:]),
+                left_right.reshape(-1, *arr.shape[2:]),
+            ])
             
             # Edge pixels should not be too dark (avoid black artifacts)
-            for pixel in edge_pixels:
-                avg_brightness = sum(pixel) / 3 if isinstance(pixel, tuple) else pixel
-                assert avg_brightness > 100, f"Edge artifact detected: pixel {pixel}"
+            # Per-pixel channel mean as one float32 reduction over the contiguous samples
+            brightness = edge_pixels.mean(axis=-1, dtype=np.float32) if edge_pixels.ndim == 2 else edge_pixels
+            darkest = brightness.argmin()
+            assert brightness[darkest] > 100, f"Edge artifact detected: pixel {edge_pixels[darkest]}"
 
 
 class TestErrorHandling:
@@ -497,11 +486,6 @@ class TestErrorHandling:
     
     def test_missing_file_handling(self):
         """Test handling of missing input files"""
-        try:
-            from src.grungeworks import GrungeWorksAgent
-        except ImportError:
-            pytest.skip("GrungeWorks agent not available")
-        
         agent = GrungeWorksAgent()
         
         # Test with non-existent files
@@ -513,11 +497,6 @@ class TestErrorHandling:
     
     def test_invalid_image_handling(self):
         """Test handling of invalid or corrupted images"""
-        try:
-            from src.grungeworks.filters import GaussianBlurFilter
-        except ImportError:
-            pytest.skip("GrungeWorks filters not available")
-        
         # Test with minimal image
         tiny_image = Image.new('RGB', (1, 1), 'white')
         blur_filter = GaussianBlurFilter(sigma=0.5)
@@ -526,24 +505,17 @@ class TestErrorHandling:
         result = blur_filter.apply(tiny_image)
         assert result.size == (1, 1), "Should preserve tiny image size"
     
-    def test_extreme_parameter_values(self):
+    @pytest.mark.parametrize("make_filter, message", [
+        # Factories, so a missing grungeworks import is reported as a skip rather than at collection
+        pytest.param(lambda: GaussianBlurFilter(sigma=10.0), "Should handle extreme blur", id="blur"),
+        pytest.param(lambda: JPEGArtifactFilter(quality=1), "Should handle extreme compression", id="jpeg"),
+    ])
+    def test_extreme_parameter_values(self, make_filter, message: str):
         """Test filters with extreme parameter values"""
-        try:
-            from src.grungeworks.filters import GaussianBlurFilter, JPEGArtifactFilter
-        except ImportError:
-            pytest.skip("GrungeWorks filters not available")
-        
-        test_image = TestFixtures.create_mock_png_image(100, 100)
-        
-        # Test extreme blur
-        extreme_blur = GaussianBlurFilter(sigma=10.0)
-        result = extreme_blur.apply(test_image)
-        assert result.size == test_image.size, "Should handle extreme blur"
+        test_image = _mock_image(100, 100)
         
-        # Test extreme JPEG compression
-        extreme_jpeg = JPEGArtifactFilter(quality=1)
-        result = extreme_jpeg.apply(test_image)
-        assert result.size == test_image.size, "Should handle extreme compression"
+        result = make_filter().apply(test_image)
+        assert result.size == test_image.size, message
 
 
 if __name__ == "__main__":
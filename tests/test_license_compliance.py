@@ -4,10 +4,78 @@ Scans /symbols/ and /noise_assets/ for license compliance
 """
 
 import csv
+from dataclasses import dataclass
 from pathlib import Path
 
 import pytest
 
+_REPO_ROOT = Path(__file__).parent.parent
+_REQUIRED_COLUMNS = ("filename", "licence", "source-URL")
+
+
+@dataclass(frozen=True)
+class LicenseData:
+    """License CSV and symbols/ contents, parsed once per session"""
+
+    rows: tuple[tuple[str, str, str], ...]
+    svg_names: frozenset[str]
+    fieldnames: tuple[str, ...]
+
+
+def _read_license_csv(
+    license_csv_path: Path,
+) -> tuple[tuple[str, ...], tuple[tuple[str, str, str], ...]]:
+    """Parse the license CSV into its header and stripped row tuples
+
+    Rows are (filename, licence, source-URL), read with csv.reader and column
+    indices from the header rather than a dict per row. Blank lines are skipped
+    and missing trailing cells read as "". If a required column is missing no
+    rows are returned; test_license_csv_structure reports it.
+    """
+    with open(license_csv_path, newline="") as csvfile:
+        reader = csv.reader(csvfile)
+        header = tuple(next(reader, ()))
+        if not set(_REQUIRED_COLUMNS).issubset(header):
+            return header, ()
+        indices = tuple(header.index(col) for col in _REQUIRED_COLUMNS)
+        rows = tuple(
+            tuple(row[idx].strip() if idx < len(row) else "" for idx in indices)
+            for row in reader
+            if row  # csv.reader yields [] for blank lines; DictReader skipped them
+        )
+    return header, rows
+
+
+@pytest.fixture(scope="session")
+def symbols_directory() -> Path:
+    """Path to symbols directory"""
+    return _REPO_ROOT / "symbols"
+
+
+@pytest.fixture(scope="session")
+def license_csv_path(symbols_directory: Path) -> Path:
+    """Path to license CSV file"""
+    return symbols_directory / "symbol_licences.csv"
+
+
+@pytest.fixture(scope="session")
+def svg_names(symbols_directory: Path) -> frozenset[str]:
+    """Names of the SVG files in symbols/, empty if the directory is missing"""
+    if not symbols_directory.exists():
+        return frozenset()
+    return frozenset(f.name for f in symbols_directory.glob("*.svg"))
+
+
+@pytest.fixture(scope="session")
+def license_data(
+    license_csv_path: Path, svg_names: frozenset[str]
+) -> LicenseData | None:
+    """Parsed license CSV plus SVG names, or None if the CSV doesn't exist yet"""
+    if not license_csv_path.exists():
+        return None
+    fieldnames, rows = _read_license_csv(license_csv_path)
+    return LicenseData(rows=rows, svg_names=svg_names, fieldnames=fieldnames)
+
 
 class TestLicenseCompliance:
     """Test suite for license compliance validation"""
@@ -30,76 +98,52 @@ class TestLicenseCompliance:
         "Unlicense",
     }
 
-    @pytest.fixture
-    def symbols_directory(self) -> Path:
-        """Path to symbols directory"""
-        return Path(__file__).parent.parent / "symbols"
-
     @pytest.fixture
     def noise_assets_directory(self) -> Path:
         """Path to noise_assets directory"""
-        return Path(__file__).parent.parent / "noise_assets"
-
-    @pytest.fixture
-    def license_csv_path(self) -> Path:
-        """Path to license CSV file"""
-        return Path(__file__).parent.parent / "symbols" / "symbol_licences.csv"
+        return _REPO_ROOT / "noise_assets"
 
     def test_symbols_directory_exists(self, symbols_directory: Path):
         """Test that symbols directory exists"""
         assert symbols_directory.exists(), "symbols/ directory must exist"
 
-    def test_license_csv_exists(self, license_csv_path: Path):
+    def test_license_csv_exists(self, license_data: LicenseData | None):
         """Test that license CSV file exists"""
-        if not license_csv_path.exists():
+        if license_data is None:
             pytest.skip("symbol_licences.csv not created yet by VectorForge")
 
-    def test_license_csv_structure(self, license_csv_path: Path):
+    def test_license_csv_structure(self, license_data: LicenseData | None):
         """Test that license CSV has correct structure"""
-        if not license_csv_path.exists():
+        if license_data is None:
             pytest.skip("symbol_licences.csv not found")
 
-        with open(license_csv_path, newline="") as csvfile:
-            reader = csv.DictReader(csvfile)
-
-            # Check required columns
-            required_columns = {"filename", "licence", "source-URL"}
-            actual_columns = set(reader.fieldnames or [])
-            assert required_columns.issubset(
-                actual_columns
-            ), f"Missing required columns: {required_columns - actual_columns}"
+        # Check required columns
+        required_columns = set(_REQUIRED_COLUMNS)
+        actual_columns = set(license_data.fieldnames)
+        assert required_columns.issubset(
+            actual_columns
+        ), f"Missing required columns: {required_columns - actual_columns}"
 
-            # Check each row has data
-            row_count = 0
-            for row in reader:
-                row_count += 1
-                assert row["filename"].strip(), f"Empty filename in row {row_count}"
-                assert row["licence"].strip(), f"Empty licence in row {row_count}"
-                # source-URL can be empty for original works
+        # Check each row has data
+        rows = license_data.rows
+        for row_count, (filename, license_name, _source_url) in enumerate(rows, 1):
+            assert filename, f"Empty filename in row {row_count}"
+            assert license_name, f"Empty licence in row {row_count}"
+            # source-URL can be empty for original works
 
-            assert row_count > 0, "License CSV cannot be empty"
+        assert rows, "License CSV cannot be empty"
 
-    def test_all_symbols_have_license_entries(
-        self, symbols_directory: Path, license_csv_path: Path
-    ):
+    def test_all_symbols_have_license_entries(self, license_data: LicenseData | None):
         """Test that every SVG file has a corresponding license entry"""
-        if not license_csv_path.exists():
+        if license_data is None:
             pytest.skip("symbol_licences.csv not found")
 
-        # Get all SVG files
-        svg_files = set()
-        if symbols_directory.exists():
-            svg_files = {f.name for f in symbols_directory.glob("*.svg")}
-
+        svg_files = license_data.svg_names
         if not svg_files:
             pytest.skip("No SVG files found in symbols/")
 
         # Get licensed files
-        licensed_files = set()
-        with open(license_csv_path, newline="") as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                licensed_files.add(row["filename"].strip())
+        licensed_files = {filename for filename, _, _ in license_data.rows}
 
         # Check coverage
         missing_licenses = svg_files - licensed_files
@@ -115,23 +159,19 @@ class TestLicenseCompliance:
                 f"Warning: License entries for non-existent files: {orphaned_licenses}"
             )
 
-    def test_only_approved_licenses(self, license_csv_path: Path):
+    def test_only_approved_licenses(self, license_data: LicenseData | None):
         """Test that only OSI-approved or CC licenses are used"""
-        if not license_csv_path.exists():
+        if license_data is None:
             pytest.skip("symbol_licences.csv not found")
 
         unapproved_licenses = []
 
-        with open(license_csv_path, newline="") as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row_num, row in enumerate(reader, 1):
-                license_name = row["licence"].strip()
-                filename = row["filename"].strip()
-
-                if license_name not in self.APPROVED_LICENSES:
-                    unapproved_licenses.append(
-                        {"row": row_num, "filename": filename, "license": license_name}
-                    )
+        rows = license_data.rows
+        for row_num, (filename, license_name, _source_url) in enumerate(rows, 1):
+            if license_name not in self.APPROVED_LICENSES:
+                unapproved_licenses.append(
+                    {"row": row_num, "filename": filename, "license": license_name}
+                )
 
         if unapproved_licenses:
             error_msg = "Non-approved licenses found:\n"
@@ -143,27 +183,23 @@ class TestLicenseCompliance:
 
             pytest.fail(error_msg)
 
-    def test_source_urls_valid_format(self, license_csv_path: Path):
+    def test_source_urls_valid_format(self, license_data: LicenseData | None):
         """Test that source URLs are valid when provided"""
-        if not license_csv_path.exists():
+        if license_data is None:
             pytest.skip("symbol_licences.csv not found")
 
         invalid_urls = []
 
-        with open(license_csv_path, newline="") as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row_num, row in enumerate(reader, 1):
-                source_url = row.get("source-URL", "").strip()
-                filename = row["filename"].strip()
-
-                if source_url:  # Only validate non-empty URLs
-                    if not (
-                        source_url.startswith("http://")
-                        or source_url.startswith("https://")
-                    ):
-                        invalid_urls.append(
-                            {"row": row_num, "filename": filename, "url": source_url}
-                        )
+        rows = license_data.rows
+        for row_num, (filename, _license_name, source_url) in enumerate(rows, 1):
+            if source_url:  # Only validate non-empty URLs
+                if not (
+                    source_url.startswith("http://")
+                    or source_url.startswith("https://")
+                ):
+                    invalid_urls.append(
+                        {"row": row_num, "filename": filename, "url": source_url}
+                    )
 
         if invalid_urls:
             error_msg = "Invalid source URLs found:\n"
@@ -173,7 +209,9 @@ class TestLicenseCompliance:
                 )
             pytest.fail(error_msg)
 
-    def test_no_proprietary_content(self, symbols_directory: Path):
+    def test_no_proprietary_content(
+        self, symbols_directory: Path, svg_names: frozenset[str]
+    ):
         """Test that no proprietary content is included"""
         if not symbols_directory.exists():
             pytest.skip("symbols/ directory not found")
@@ -192,11 +230,11 @@ class TestLicenseCompliance:
         ]
 
         suspicious_files = []
-        for svg_file in symbols_directory.glob("*.svg"):
-            filename_lower = svg_file.name.lower()
+        for svg_name in sorted(svg_names):
+            filename_lower = svg_name.lower()
             for indicator in proprietary_indicators:
                 if indicator in filename_lower:
-                    suspicious_files.append((svg_file.name, indicator))
+                    suspicious_files.append((svg_name, indicator))
 
         if suspicious_files:
             error_msg = "Potentially proprietary content detected:\n"
@@ -204,30 +242,25 @@ class TestLicenseCompliance:
                 error_msg += f"  {filename} (contains '{indicator}')\n"
             pytest.fail(error_msg)
 
-    def test_cc_attribution_compliance(self, license_csv_path: Path):
+    def test_cc_attribution_compliance(self, license_data: LicenseData | None):
         """Test CC-licensed content has proper attribution"""
-        if not license_csv_path.exists():
+        if license_data is None:
             pytest.skip("symbol_licences.csv not found")
 
         cc_without_source = []
 
-        with open(license_csv_path, newline="") as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row_num, row in enumerate(reader, 1):
-                license_name = row["licence"].strip()
-                source_url = row.get("source-URL", "").strip()
-                filename = row["filename"].strip()
-
-                # CC licenses (except CC0) require attribution
-                if license_name.startswith("CC-") and license_name != "CC0-1.0":
-                    if not source_url:
-                        cc_without_source.append(
-                            {
-                                "row": row_num,
-                                "filename": filename,
-                                "license": license_name,
-                            }
-                        )
+        rows = license_data.rows
+        for row_num, (filename, license_name, source_url) in enumerate(rows, 1):
+            # CC licenses (except CC0) require attribution
+            if license_name.startswith("CC-") and license_name != "CC0-1.0":
+                if not source_url:
+                    cc_without_source.append(
+                        {
+                            "row": row_num,
+                            "filename": filename,
+                            "license": license_name,
+                        }
+                    )
 
         if cc_without_source:
             error_msg = "CC-licensed files missing source URLs for attribution:\n"
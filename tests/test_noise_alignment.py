@@ -44,28 +44,40 @@ class AlignmentVerifier:
 
         # For each symbol in ground truth, try to detect it in the image
         if "symbols" in ground_truth:
-            for symbol in ground_truth["symbols"]:
-                # Expected position from JSON (in mm, convert to pixels)
-                expected_x = symbol.get("x_mm", 0) * 3.78  # 300 DPI conversion
-                expected_y = symbol.get("y_mm", 0) * 3.78
-
-                # Search area around expected position
-                search_radius = 20  # pixels
-                x_min = max(0, int(expected_x - search_radius))
-                x_max = min(img.shape[1], int(expected_x + search_radius))
-                y_min = max(0, int(expected_y - search_radius))
-                y_max = min(img.shape[0], int(expected_y + search_radius))
-
-                # Extract search region
-                search_region = img[y_min:y_max, x_min:x_max]
+            symbols = ground_truth["symbols"]
+
+            # Expected positions from JSON (in mm, convert to pixels)
+            expected_xs = np.fromiter(
+                (symbol.get("x_mm", 0) for symbol in symbols), dtype=np.float64
+            ) * 3.78  # 300 DPI conversion
+            expected_ys = np.fromiter(
+                (symbol.get("y_mm", 0) for symbol in symbols), dtype=np.float64
+            ) * 3.78
+
+            # Search areas around the expected positions, clamped to the image
+            search_radius = 20  # pixels
+            height, width = img.shape
+            x_mins = np.maximum((expected_xs - search_radius).astype(np.intp), 0)
+            x_maxs = np.minimum((expected_xs + search_radius).astype(np.intp), width)
+            y_mins = np.maximum((expected_ys - search_radius).astype(np.intp), 0)
+            y_maxs = np.minimum((expected_ys + search_radius).astype(np.intp), height)
+
+            # Binarize the whole image once; search windows may overlap. OpenCV
+            # 3.2+ findContours leaves its input untouched, so crops need no copy
+            _, binary = cv2.threshold(img, 127, 255, cv2.THRESH_BINARY_INV)
+
+            for expected_x, expected_y, x_min, x_max, y_min, y_max in zip(
+                expected_xs.tolist(), expected_ys.tolist(),
+                x_mins.tolist(), x_maxs.tolist(), y_mins.tolist(), y_maxs.tolist(),
+                strict=True,
+            ):
+                # Extract binarized search region
+                search_region = binary[y_min:y_max, x_min:x_max]
 
                 # Use template matching or feature detection
                 # For now, find contours and select the one closest to expected position
-                _, thresh = cv2.threshold(
-                    search_region, 127, 255, cv2.THRESH_BINARY_INV
-                )
                 contours, _ = cv2.findContours(
-                    thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+                    search_region, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
                 )
 
                 if contours:
@@ -91,7 +103,7 @@ class AlignmentVerifier:
         self,
         original_centroids: list[tuple[float, float]],
         processed_centroids: list[tuple[float, float]],
-    ) -> list[float]:
+    ) -> np.ndarray:
         """Calculate pixel shifts between original and processed centroids.
 
         Args:
@@ -99,17 +111,14 @@ class AlignmentVerifier:
             processed_centroids: Centroids from processed image
 
         Returns:
-            List of shift distances in pixels
+            Array of shift distances in pixels, one per centroid pair
         """
         if len(original_centroids) != len(processed_centroids):
             raise ValueError("Centroid lists must have same length")
 
-        shifts = []
-        for (x1, y1), (x2, y2) in zip(original_centroids, processed_centroids, strict=False):
-            shift = np.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
-            shifts.append(shift)
-
-        return shifts
+        original = np.asarray(original_centroids, dtype=np.float64).reshape(-1, 2)
+        processed = np.asarray(processed_centroids, dtype=np.float64).reshape(-1, 2)
+        return np.linalg.norm(processed - original, axis=1)
 
     def verify_alignment(
         self, original_img_path: str, processed_img_path: str, json_path: str
@@ -139,15 +148,15 @@ class AlignmentVerifier:
             )
 
             # Check if all shifts are within tolerance
-            max_shift = max(shifts) if shifts else 0
+            max_shift = float(shifts.max()) if shifts.size else 0
             alignment_preserved = max_shift <= self.tolerance_px
 
             return {
                 "alignment_preserved": alignment_preserved,
                 "max_shift_px": max_shift,
-                "avg_shift_px": np.mean(shifts) if shifts else 0,
-                "num_symbols": len(shifts),
-                "shifts": shifts,
+                "avg_shift_px": float(shifts.mean()) if shifts.size else 0,
+                "num_symbols": shifts.size,
+                "shifts": shifts.tolist(),
                 "tolerance_px": self.tolerance_px,
             }
 